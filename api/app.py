@@ -5,7 +5,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from db.database import init_db
+from db.database import dispose_async_engine, init_db
 from api.routes import products, prices, deals, exports, health
 
 
@@ -31,6 +31,7 @@ async def lifespan(app: FastAPI):
     logging.getLogger(__name__).info("Amazon Price Monitor started")
     yield
     logging.getLogger(__name__).info("Amazon Price Monitor shutting down")
+    await dispose_async_engine()
 
 
 def create_app() -> FastAPI:
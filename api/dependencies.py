@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from clients.amazon_paapi import AmazonPAAPIClient
+from clients.keepa_client import KeepaClient
 from db.database import get_db
+from db.repository import UnitOfWork
 from services.product_service import ProductService
 from services.price_analyzer import PriceAnalyzer
 from services.export_service import ExportService
 
 
+@lru_cache(maxsize=1)
+def get_paapi_client() -> AmazonPAAPIClient:
+    return AmazonPAAPIClient()
+
+
+@lru_cache(maxsize=1)
+def get_keepa_client() -> KeepaClient:
+    return KeepaClient()
+
+
+def get_uow(session: Session = Depends(get_db)) -> UnitOfWork:
+    return UnitOfWork(session)
+
+
 def get_product_service(session: Session = Depends(get_db)) -> ProductService:
     return ProductService(session)
 
@@ -2,34 +2,34 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.schemas import DealResponse, DealScanResponse, DealDismissResponse
-from api.dependencies import get_product_service
-from db.database import get_db
-from db.repository import DealRepository, ProductRepository
+from api.dependencies import get_product_service, get_uow
+from db.database import get_async_db
+from db.repository import DealRepository, UnitOfWork
 from services.product_service import ProductService
 
 router = APIRouter(prefix="/api/v1/deals", tags=["deals"])
 
+DEAL_LIST_ADAPTER = TypeAdapter(List[DealResponse])
 
-@router.get("", response_model=List[DealResponse])
-def list_active_deals(
+
+@router.get("", response_model=None, responses={200: {"model": List[DealResponse]}})
+async def list_active_deals(
     deal_type: Optional[str] = None,
     min_roi: Optional[float] = None,
     skip: int = 0,
     limit: int = 100,
-    session: Session = Depends(get_db),
+    session: AsyncSession = Depends(get_async_db),
 ):
-    deal_repo = DealRepository(session)
-    product_repo = ProductRepository(session)
-    deals = deal_repo.get_active(deal_type=deal_type, min_roi=min_roi, skip=skip, limit=limit)
+    stmt = DealRepository.get_active_stmt(deal_type=deal_type, min_roi=min_roi, skip=skip, limit=limit)
+    deals = (await session.execute(stmt)).scalars().all()
 
-    results = []
-    for deal in deals:
-        product = product_repo.get_by_asin(deal.asin)
-        results.append(DealResponse(
+    results = [
+        DealResponse.model_construct(
             id=deal.id,
             asin=deal.asin,
             deal_type=deal.deal_type,
@@ -40,14 +40,16 @@ def list_active_deals(
             estimated_roi=deal.estimated_roi,
             is_active=deal.is_active,
             detected_at=deal.detected_at,
-            product_title=product.title if product else "",
-        ))
-    return results
+            product_title=deal.product.title if deal.product else "",
+        )
+        for deal in deals
+    ]
+    return Response(DEAL_LIST_ADAPTER.dump_json(results), media_type="application/json")
 
 
 @router.post("/scan", response_model=DealScanResponse)
-def scan_for_deals(service: ProductService = Depends(get_product_service)):
-    results = service.check_all_active()
+async def scan_for_deals(service: ProductService = Depends(get_product_service)):
+    results = await service.check_all_active_async()
     total_deals = sum(r.get("deals_found", 0) for r in results)
     return DealScanResponse(
         checked=len(results),
@@ -57,9 +59,8 @@ def scan_for_deals(service: ProductService = Depends(get_product_service)):
 
 
 @router.post("/{deal_id}/dismiss", response_model=DealDismissResponse)
-def dismiss_deal(deal_id: int, session: Session = Depends(get_db)):
-    deal_repo = DealRepository(session)
-    success = deal_repo.dismiss(deal_id)
+def dismiss_deal(deal_id: int, uow: UnitOfWork = Depends(get_uow)):
+    success = uow.deals.dismiss(deal_id)
     if not success:
         raise HTTPException(status_code=404, detail="Deal not found")
     return DealDismissResponse(deal_id=deal_id, dismissed=True)
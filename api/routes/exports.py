@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import PlainTextResponse, JSONResponse
+import orjson
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import StreamingResponse
 
 from api.dependencies import get_export_service
 from services.export_service import ExportService
@@ -11,15 +12,14 @@ router = APIRouter(prefix="/api/v1/exports", tags=["exports"])
 
 @router.get("/json")
 def export_json(service: ExportService = Depends(get_export_service)):
-    data = service.export_json(save_to_file=False)
-    return JSONResponse(content=__import__("json").loads(data))
+    data = service.export_json(save_to_file=False, as_obj=True)
+    return Response(orjson.dumps(data), media_type="application/json")
 
 
 @router.get("/csv")
 def export_csv(service: ExportService = Depends(get_export_service)):
-    data = service.export_csv(save_to_file=False)
-    return PlainTextResponse(
-        content=data,
+    return StreamingResponse(
+        service.iter_csv_rows(),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=price_monitor_export.csv"},
     )
@@ -1,32 +1,31 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.schemas import HealthResponse
+from api.dependencies import get_keepa_client, get_paapi_client
 from clients.amazon_paapi import AmazonPAAPIClient
 from clients.keepa_client import KeepaClient
-from db.database import get_db
+from db.database import get_async_db
 from db.repository import ProductRepository, DealRepository
 
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health", response_model=HealthResponse)
-def health_check(session: Session = Depends(get_db)):
-    product_repo = ProductRepository(session)
-    deal_repo = DealRepository(session)
-
-    paapi = AmazonPAAPIClient()
-    keepa = KeepaClient()
-
-    products = product_repo.get_all_active()
-    deals = deal_repo.get_active()
+async def health_check(
+    session: AsyncSession = Depends(get_async_db),
+    paapi: AmazonPAAPIClient = Depends(get_paapi_client),
+    keepa: KeepaClient = Depends(get_keepa_client),
+):
+    products = (await session.execute(ProductRepository.count_active_stmt())).scalar_one()
+    deals = (await session.execute(DealRepository.count_active_stmt())).scalar_one()
 
     return HealthResponse(
         status="ok",
         paapi_configured=paapi.is_configured(),
         keepa_configured=keepa.is_configured(),
-        monitored_products=len(products),
-        active_deals=len(deals),
+        monitored_products=products,
+        active_deals=deals,
     )
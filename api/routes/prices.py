@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.schemas import (
     PriceHistoryResponse,
@@ -11,33 +11,56 @@ from api.schemas import (
     ProfitEstimateResponse,
 )
 from api.dependencies import get_price_analyzer
-from db.database import get_db
+from db.database import get_async_db
+from db.models import PriceRecord
 from db.repository import PriceRecordRepository
 from services.price_analyzer import PriceAnalyzer
 
 router = APIRouter(prefix="/api/v1/prices", tags=["prices"])
 
 
-@router.get("/{asin}/history", response_model=PriceHistoryResponse)
-def get_price_history(asin: str, limit: int = 100, session: Session = Depends(get_db)):
-    repo = PriceRecordRepository(session)
-    records = repo.get_history(asin, limit=limit)
+def _price_row_to_resp(r: PriceRecord) -> PriceRecordResponse:
+    """Build a response from a DB row without re-running pydantic validation."""
+    return PriceRecordResponse.model_construct(
+        id=r.id,
+        asin=r.asin,
+        checked_at=r.checked_at,
+        current_price=r.current_price,
+        list_price=r.list_price,
+        buy_box_price=r.buy_box_price,
+        savings_percent=r.savings_percent,
+        sales_rank=r.sales_rank,
+        avg_30d=r.avg_30d,
+        avg_90d=r.avg_90d,
+        avg_180d=r.avg_180d,
+        all_time_low=r.all_time_low,
+        all_time_high=r.all_time_high,
+        source=r.source,
+    )
+
+
+@router.get("/{asin}/history", response_model=None, responses={200: {"model": PriceHistoryResponse}})
+async def get_price_history(asin: str, limit: int = 100, session: AsyncSession = Depends(get_async_db)):
+    records = (await session.execute(PriceRecordRepository.get_history_stmt(asin, limit))).scalars().all()
 
     stats = None
-    prices = [r.current_price for r in records if r.current_price is not None]
-    if prices:
+    min_price, max_price, avg_price, count = (
+        await session.execute(PriceRecordRepository.get_stats_stmt(asin))
+    ).one()
+    if count:
         stats = PriceStats(
-            min_price=min(prices),
-            max_price=max(prices),
-            avg_price=round(sum(prices) / len(prices), 2),
-            record_count=len(prices),
+            min_price=min_price,
+            max_price=max_price,
+            avg_price=round(avg_price, 2),
+            record_count=count,
         )
 
-    return PriceHistoryResponse(
+    history = PriceHistoryResponse(
         asin=asin,
-        records=[PriceRecordResponse.model_validate(r) for r in records],
+        records=[_price_row_to_resp(r) for r in records],
         stats=stats,
     )
+    return Response(history.model_dump_json(warnings=False), media_type="application/json")
 
 
 @router.post("/profit-estimate", response_model=ProfitEstimateResponse)
@@ -2,22 +2,37 @@ from __future__ import annotations
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.schemas import ProductCreate, ProductResponse, ProductSearchRequest, ProductSearchResult
-from api.dependencies import get_product_service
-from db.database import get_db
-from db.repository import ProductRepository
+from api.dependencies import get_product_service, get_uow
+from db.database import get_async_db
+from db.models import Product
+from db.repository import ProductRepository, UnitOfWork
 from services.product_service import ProductService
 
 router = APIRouter(prefix="/api/v1/products", tags=["products"])
 
+PRODUCT_LIST_ADAPTER = TypeAdapter(List[ProductResponse])
+SEARCH_RESULT_ADAPTER = TypeAdapter(List[ProductSearchResult])
 
-@router.get("", response_model=List[ProductResponse])
-def list_products(skip: int = 0, limit: int = 100, session: Session = Depends(get_db)):
-    repo = ProductRepository(session)
-    return repo.list_all(skip=skip, limit=limit)
+
+def _product_to_resp(p: Product) -> ProductResponse:
+    """Build a response from a DB row without re-running pydantic validation."""
+    return ProductResponse.model_construct(
+        **{name: getattr(p, name) for name in ProductResponse.model_fields}
+    )
+
+
+@router.get("", response_model=None, responses={200: {"model": List[ProductResponse]}})
+async def list_products(skip: int = 0, limit: int = 100, session: AsyncSession = Depends(get_async_db)):
+    products = (await session.execute(ProductRepository.list_all_stmt(skip, limit))).scalars().all()
+    return Response(
+        PRODUCT_LIST_ADAPTER.dump_json([_product_to_resp(p) for p in products]),
+        media_type="application/json",
+    )
 
 
 @router.post("", response_model=dict)
@@ -33,14 +48,14 @@ def add_product(
     return result
 
 
-@router.post("/search", response_model=List[ProductSearchResult])
+@router.post("/search", response_model=None, responses={200: {"model": List[ProductSearchResult]}})
 def search_products(
     body: ProductSearchRequest,
     service: ProductService = Depends(get_product_service),
 ):
     results = service.search_products(body.keywords, body.max_results)
-    return [
-        ProductSearchResult(
+    items = [
+        ProductSearchResult.model_construct(
             asin=r.get("asin", ""),
             title=r.get("title", ""),
             brand=r.get("brand", ""),
@@ -49,20 +64,19 @@ def search_products(
         )
         for r in results
     ]
+    return Response(SEARCH_RESULT_ADAPTER.dump_json(items), media_type="application/json")
 
 
 @router.get("/{asin}", response_model=ProductResponse)
-def get_product(asin: str, session: Session = Depends(get_db)):
-    repo = ProductRepository(session)
-    product = repo.get_by_asin(asin)
+async def get_product(asin: str, session: AsyncSession = Depends(get_async_db)):
+    product = (await session.execute(ProductRepository.get_by_asin_stmt(asin))).scalar_one_or_none()
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     return product
 
 
 @router.delete("/{asin}")
-def deactivate_product(asin: str, session: Session = Depends(get_db)):
-    repo = ProductRepository(session)
-    if not repo.deactivate(asin):
+def deactivate_product(asin: str, uow: UnitOfWork = Depends(get_uow)):
+    if not uow.products.deactivate(asin):
         raise HTTPException(status_code=404, detail="Product not found")
     return {"asin": asin, "deactivated": True}
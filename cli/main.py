@@ -7,12 +7,12 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import typer
-import uvicorn
 
-from config.settings import get_settings
-from db.database import init_db, get_session_factory
-from services.product_service import ProductService
-from services.export_service import ExportService
+# Database, services and the server are imported inside each command so
+# that --help and argument errors don't pay for loading them.
+
+# uvloop has no Windows build; fall back to the stdlib loop there
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
 
 app = typer.Typer(
     name="amazon-price-monitor",
@@ -23,6 +23,9 @@ app = typer.Typer(
 @app.command()
 def check(asins: list[str] = typer.Argument(..., help="One or more ASINs to check")):
     """One-shot price check for specific ASINs."""
+    from db.database import init_db, get_session_factory
+    from services.product_service import ProductService
+
     init_db()
     factory = get_session_factory()
     session = factory()
@@ -40,6 +43,9 @@ def check(asins: list[str] = typer.Argument(..., help="One or more ASINs to chec
 @app.command()
 def search(keywords: str = typer.Argument(..., help="Search keywords")):
     """Search Amazon for products."""
+    from db.database import init_db, get_session_factory
+    from services.product_service import ProductService
+
     init_db()
     factory = get_session_factory()
     session = factory()
@@ -62,14 +68,14 @@ def deals(
     min_roi: float = typer.Option(None, help="Minimum ROI percentage"),
 ):
     """Show active deals."""
+    from db.database import init_db, get_session_factory
+    from db.repository import DealRepository
+
     init_db()
     factory = get_session_factory()
     session = factory()
     try:
-        from db.repository import DealRepository, ProductRepository
-
         deal_repo = DealRepository(session)
-        product_repo = ProductRepository(session)
         active_deals = deal_repo.get_active(deal_type=deal_type, min_roi=min_roi)
 
         if not active_deals:
@@ -77,7 +83,7 @@ def deals(
             return
 
         for d in active_deals:
-            product = product_repo.get_by_asin(d.asin)
+            product = d.product
             title = product.title[:40] if product and product.title else d.asin
             price_str = f"${d.trigger_price:.2f}" if d.trigger_price else "N/A"
             drop_str = f" ({d.drop_percent:.1f}% off)" if d.drop_percent else ""
@@ -93,6 +99,9 @@ def export(
     save: bool = typer.Option(False, help="Save to file"),
 ):
     """Export monitored data."""
+    from db.database import init_db, get_session_factory
+    from services.export_service import ExportService
+
     init_db()
     factory = get_session_factory()
     session = factory()
@@ -102,7 +111,7 @@ def export(
             data = service.export_csv(save_to_file=save)
         else:
             data = service.export_json(save_to_file=save)
-        typer.echo(data)
+        typer.echo(f"Exported to {data}" if save else data)
     finally:
         session.close()
 
@@ -113,6 +122,10 @@ def serve(
     port: int = typer.Option(None, help="Port to listen on"),
 ):
     """Start the FastAPI server."""
+    import uvicorn
+
+    from config.settings import get_settings
+
     settings = get_settings().server
     uvicorn.run(
         "api.app:create_app",
@@ -120,6 +133,8 @@ def serve(
         host=host or settings.host,
         port=port or settings.port,
         reload=settings.reload,
+        loop=UVICORN_LOOP,
+        http="httptools",
     )
 
 
@@ -129,7 +144,11 @@ def run(
     port: int = typer.Option(None, help="Port to listen on"),
 ):
     """Start scheduler + FastAPI server."""
+    import uvicorn
+
     from api.app import setup_logging
+    from config.settings import get_settings
+    from db.database import init_db
 
     setup_logging()
     init_db()
@@ -145,6 +164,8 @@ def run(
         host=host or settings.host,
         port=port or settings.port,
         reload=settings.reload,
+        loop=UVICORN_LOOP,
+        http="httptools",
     )
 
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from operator import attrgetter
 from typing import Any
 
-from clients.base import BaseClient, RateLimiter
+from clients.base import BaseClient, RateLimiter, batched
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -11,10 +13,32 @@ logger = logging.getLogger(__name__)
 # PA-API batch limit
 MAX_BATCH_SIZE = 10
 
+_COUNTRY_CODE_MAP = {
+    "www.amazon.com": "US",
+    "www.amazon.co.uk": "UK",
+    "www.amazon.de": "DE",
+    "www.amazon.ca": "CA",
+}
 
-def _chunks(lst: list, n: int):
-    for i in range(0, len(lst), n):
-        yield lst[i : i + n]
+
+# Attribute paths into PA-API SDK objects, resolved in C by attrgetter
+_TITLE = attrgetter("item_info.title.display_value")
+_BRAND = attrgetter("item_info.by_line_info.brand.display_value")
+_CATEGORY = attrgetter("item_info.classifications.binding.display_value")
+_IMAGE_URL = attrgetter("images.primary.large.url")
+_LISTINGS = attrgetter("offers.listings")
+_PRICE_AMOUNT = attrgetter("price.amount")
+_SAVINGS_PERCENT = attrgetter("price.savings.percentage")
+_SAVING_BASIS_AMOUNT = attrgetter("saving_basis.amount")
+_SALES_RANK = attrgetter("browse_node_info.website_sales_rank.sales_rank")
+
+
+def _lookup(getter: attrgetter, obj: Any) -> Any:
+    """Apply an attribute path, returning None if any link is missing."""
+    try:
+        return getter(obj)
+    except AttributeError:
+        return None
 
 
 class AmazonPAAPIClient(BaseClient):
@@ -28,6 +52,9 @@ class AmazonPAAPIClient(BaseClient):
         self.marketplace = settings.marketplace
         self._api = None
 
+        # Bound in-flight batches to what the rate limit can serve per second
+        self.max_concurrency = max(1, int(settings.requests_per_second))
+
         rate_limiter = RateLimiter(
             max_calls=settings.requests_per_second, period_seconds=1.0
         )
@@ -54,13 +81,7 @@ class AmazonPAAPIClient(BaseClient):
         return self._api
 
     def _country_code(self) -> str:
-        mapping = {
-            "www.amazon.com": "US",
-            "www.amazon.co.uk": "UK",
-            "www.amazon.de": "DE",
-            "www.amazon.ca": "CA",
-        }
-        return mapping.get(self.marketplace, "US")
+        return _COUNTRY_CODE_MAP.get(self.marketplace, "US")
 
     def get_items(self, asins: list[str]) -> list[dict[str, Any]]:
         if not self.is_configured():
@@ -70,10 +91,11 @@ class AmazonPAAPIClient(BaseClient):
         api = self._get_api()
         results = []
 
-        for batch in _chunks(asins, MAX_BATCH_SIZE):
+        for batch in batched(asins, MAX_BATCH_SIZE):
             self._rate_limit_sync()
             try:
-                items = api.get_items(batch)
+                # python-amazon-paapi only accepts a str or list of ASINs
+                items = api.get_items(list(batch))
                 for item in items:
                     results.append(self._parse_item(item))
             except Exception as e:
@@ -81,6 +103,29 @@ class AmazonPAAPIClient(BaseClient):
 
         return results
 
+    async def get_items_async(self, asins: list[str]) -> list[dict[str, Any]]:
+        """Like get_items, but runs the batches concurrently in the default executor."""
+        if not self.is_configured():
+            logger.warning("PA-API not configured, skipping")
+            return []
+
+        api = self._get_api()
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(batch: tuple[str, ...]) -> list[dict[str, Any]]:
+            async with semaphore:
+                await self._rate_limit()
+                try:
+                    items = await loop.run_in_executor(None, api.get_items, list(batch))
+                    return [self._parse_item(item) for item in items]
+                except Exception as e:
+                    logger.error(f"PA-API get_items error: {e}")
+                    return []
+
+        batches = await asyncio.gather(*(fetch(b) for b in batched(asins, MAX_BATCH_SIZE)))
+        return [item for batch in batches for item in batch]
+
     def search_items(self, keywords: str, max_results: int = 10) -> list[dict[str, Any]]:
         if not self.is_configured():
             logger.warning("PA-API not configured, skipping")
@@ -98,77 +143,24 @@ class AmazonPAAPIClient(BaseClient):
 
     def _parse_item(self, item: Any) -> dict[str, Any]:
         """Parse a PA-API item response into a flat dict."""
-        data: dict[str, Any] = {
+        listings = _lookup(_LISTINGS, item)
+        listing = listings[0] if listings else None
+
+        amount = _lookup(_PRICE_AMOUNT, listing)
+        current_price = float(amount) if amount is not None else None
+        pct = _lookup(_SAVINGS_PERCENT, listing)
+        basis = _lookup(_SAVING_BASIS_AMOUNT, listing)
+
+        return {
             "asin": getattr(item, "asin", ""),
-            "title": "",
-            "brand": "",
-            "category": "",
-            "image_url": "",
-            "current_price": None,
-            "list_price": None,
-            "buy_box_price": None,
-            "savings_percent": None,
-            "sales_rank": None,
+            "title": _lookup(_TITLE, item) or "",
+            "brand": _lookup(_BRAND, item) or "",
+            "category": _lookup(_CATEGORY, item) or "",
+            "image_url": _lookup(_IMAGE_URL, item) or "",
+            "current_price": current_price,
+            "list_price": float(basis) if basis is not None else None,
+            "buy_box_price": current_price,
+            "savings_percent": float(pct) if pct is not None else None,
+            "sales_rank": _lookup(_SALES_RANK, item),
             "deal_details": None,
         }
-
-        # Title
-        info = getattr(item, "item_info", None)
-        if info:
-            title_obj = getattr(info, "title", None)
-            if title_obj:
-                data["title"] = getattr(title_obj, "display_value", "") or ""
-
-            by_line = getattr(info, "by_line_info", None)
-            if by_line:
-                brand_obj = getattr(by_line, "brand", None)
-                if brand_obj:
-                    data["brand"] = getattr(brand_obj, "display_value", "") or ""
-
-            classifications = getattr(info, "classifications", None)
-            if classifications:
-                binding = getattr(classifications, "binding", None)
-                if binding:
-                    data["category"] = getattr(binding, "display_value", "") or ""
-
-        # Images
-        images = getattr(item, "images", None)
-        if images:
-            primary = getattr(images, "primary", None)
-            if primary:
-                large = getattr(primary, "large", None)
-                if large:
-                    data["image_url"] = getattr(large, "url", "") or ""
-
-        # Offers / pricing
-        offers = getattr(item, "offers", None)
-        if offers:
-            listings = getattr(offers, "listings", None)
-            if listings and len(listings) > 0:
-                listing = listings[0]
-                price_obj = getattr(listing, "price", None)
-                if price_obj:
-                    amount = getattr(price_obj, "amount", None)
-                    data["current_price"] = float(amount) if amount is not None else None
-
-                    savings = getattr(price_obj, "savings", None)
-                    if savings:
-                        pct = getattr(savings, "percentage", None)
-                        data["savings_percent"] = float(pct) if pct is not None else None
-
-                saving_basis = getattr(listing, "saving_basis", None)
-                if saving_basis:
-                    amount = getattr(saving_basis, "amount", None)
-                    data["list_price"] = float(amount) if amount is not None else None
-
-            # Buy box
-            data["buy_box_price"] = data["current_price"]
-
-        # Sales rank
-        browse_nodes = getattr(item, "browse_node_info", None)
-        if browse_nodes:
-            sales_rank_obj = getattr(browse_nodes, "website_sales_rank", None)
-            if sales_rank_obj:
-                data["sales_rank"] = getattr(sales_rank_obj, "sales_rank", None)
-
-        return data
@@ -7,17 +7,32 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
+try:
+    from itertools import batched
+except ImportError:  # Python < 3.12
+    from itertools import islice
+
+    def batched(iterable, n):
+        it = iter(iterable)
+        while batch := tuple(islice(it, n)):
+            yield batch
+
 logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
-    """Token-bucket rate limiter."""
+    """Leaky-bucket rate limiter allowing bursts of up to ``max_calls``.
+
+    The bucket drains at ``max_calls / period_seconds`` per second; each
+    call adds one unit and waits only if that would overflow the bucket.
+    """
 
     def __init__(self, max_calls: float, period_seconds: float = 1.0):
         self.max_calls = max_calls
         self.period = period_seconds
-        self._tokens = max_calls
-        self._last_refill = time.monotonic()
+        self._rate_per_sec = max_calls / period_seconds
+        self._level = 0.0
+        self._last_check = time.monotonic()
         self._async_lock = None
         self._sync_lock = threading.Lock()
 
@@ -26,35 +41,30 @@ class RateLimiter:
             self._async_lock = asyncio.Lock()
         return self._async_lock
 
+    def _reserve(self) -> float:
+        """Leak the bucket, add this call, and return how long to wait."""
+        now = time.monotonic()
+        level = self._level - (now - self._last_check) * self._rate_per_sec
+        if level < 0:
+            level = 0.0
+        self._last_check = now
+        wait = (level + 1 - self.max_calls) / self._rate_per_sec
+        self._level = level + 1
+        return wait
+
     async def acquire(self):
         async with self._get_async_lock():
-            now = time.monotonic()
-            elapsed = now - self._last_refill
-            self._tokens = min(self.max_calls, self._tokens + elapsed * (self.max_calls / self.period))
-            self._last_refill = now
-
-            if self._tokens < 1:
-                wait = (1 - self._tokens) * (self.period / self.max_calls)
+            wait = self._reserve()
+            if wait > 0:
                 logger.debug(f"Rate limiter waiting {wait:.2f}s")
                 await asyncio.sleep(wait)
-                self._tokens = 0
-            else:
-                self._tokens -= 1
 
     def acquire_sync(self):
         with self._sync_lock:
-            now = time.monotonic()
-            elapsed = now - self._last_refill
-            self._tokens = min(self.max_calls, self._tokens + elapsed * (self.max_calls / self.period))
-            self._last_refill = now
-
-            if self._tokens < 1:
-                wait = (1 - self._tokens) * (self.period / self.max_calls)
+            wait = self._reserve()
+            if wait > 0:
                 logger.debug(f"Rate limiter waiting {wait:.2f}s")
                 time.sleep(wait)
-                self._tokens = 0
-            else:
-                self._tokens -= 1
 
 
 class BaseClient(ABC):
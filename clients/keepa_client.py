@@ -1,13 +1,27 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from clients.base import BaseClient, RateLimiter
+from clients.base import BaseClient, RateLimiter, batched
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Keepa product request limit
+MAX_BATCH_SIZE = 100
+
+# (output field, Keepa stats key); "avg" is the average over the queried
+# stats window (180 days)
+_STAT_MAP = (
+    ("avg_180d", "avg"),
+    ("avg_30d", "avg30"),
+    ("avg_90d", "avg90"),
+    ("all_time_low", "min"),
+    ("all_time_high", "max"),
+)
+
 
 class KeepaClient(BaseClient):
     """Wrapper around the Keepa API for historical price data."""
@@ -16,6 +30,7 @@ class KeepaClient(BaseClient):
         settings = get_settings().keepa
         self.api_key = settings.api_key
         self.domain = settings.domain
+        self.requests_per_minute = settings.requests_per_minute
         self._api = None
 
         rate_limiter = RateLimiter(
@@ -51,6 +66,33 @@ class KeepaClient(BaseClient):
             logger.error(f"Keepa query error: {e}")
             return []
 
+    def get_product_data_batched(
+        self, asins: list[str], batch_size: int = MAX_BATCH_SIZE
+    ) -> list[dict[str, Any]]:
+        """Query Keepa in batches of ``batch_size`` ASINs, running batches concurrently.
+
+        Each batch is one rate-limited request; concurrency is capped at the
+        per-second rate allowed by ``requests_per_minute``.
+        """
+        if not self.is_configured():
+            logger.warning("Keepa not configured, skipping")
+            return []
+
+        batches = [list(b) for b in batched(asins, batch_size)]
+        if len(batches) <= 1:
+            return self.get_product_data(asins)
+
+        workers = max(1, min(len(batches), self.requests_per_minute // 60))
+        if workers == 1:
+            return [item for batch in batches for item in self.get_product_data(batch)]
+
+        # Build the shared client before the threads start, so they don't
+        # race to create it
+        self._get_api()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.get_product_data, batches)
+            return [item for batch in results for item in batch]
+
     def get_deals(self, price_types: list[int] | None = None, count: int = 50) -> list[dict[str, Any]]:
         if not self.is_configured():
             logger.warning("Keepa not configured, skipping")
@@ -95,33 +137,12 @@ class KeepaClient(BaseClient):
         if stats is None:
             return data
 
-        # Current price stats (index 0 = Amazon price)
-        # stats.avg contains [avg_Amazon, avg_new, avg_used, ...]
-        avg = stats.get("avg", [])
-        if len(avg) > 0 and avg[0] is not None and avg[0] > 0:
-            # Keepa prices are in cents for some domains
-            data["avg_180d"] = self._to_price(avg[0])
-
-        avg30 = stats.get("avg30", [])
-        if len(avg30) > 0 and avg30[0] is not None and avg30[0] > 0:
-            data["avg_30d"] = self._to_price(avg30[0])
-
-        avg90 = stats.get("avg90", [])
-        if len(avg90) > 0 and avg90[0] is not None and avg90[0] > 0:
-            data["avg_90d"] = self._to_price(avg90[0])
-
-        min_prices = stats.get("min", [])
-        if len(min_prices) > 0 and min_prices[0] is not None and min_prices[0] > 0:
-            data["all_time_low"] = self._to_price(min_prices[0])
-
-        max_prices = stats.get("max", [])
-        if len(max_prices) > 0 and max_prices[0] is not None and max_prices[0] > 0:
-            data["all_time_high"] = self._to_price(max_prices[0])
+        # Index 0 of each stats array is the Amazon price, in cents
+        for key, stats_key in _STAT_MAP:
+            values = stats.get(stats_key)
+            if values is not None and len(values) > 0:
+                value = values[0]
+                if value is not None and value > 0:
+                    data[key] = round(value / 100.0, 2)
 
         return data
-
-    def _to_price(self, keepa_val: int | float) -> float:
-        """Convert Keepa price value to dollars. Keepa stores US prices in cents."""
-        if self.domain == 1:  # US
-            return round(keepa_val / 100.0, 2)
-        return round(float(keepa_val) / 100.0, 2)
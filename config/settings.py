@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
-import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -15,11 +15,24 @@ DATA_DIR = BASE_DIR / "data"
 LOGS_DIR = BASE_DIR / "logs"
 
 
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    import yaml
+
+    with open(path_str) as f:
+        return yaml.safe_load(f) or {}
+
+
 def _load_yaml(path: Path) -> dict[str, Any]:
-    if path.exists():
-        with open(path) as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    """Parse a YAML file, reusing the previous result until the file changes.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _load_yaml_cached(str(path), mtime_ns)
 
 
 class AmazonSettings(BaseSettings):
@@ -51,6 +64,9 @@ class MonitoringSettings(BaseSettings):
     target_roi_percent: float = 30.0
     fba_fee_percent: float = 15.0
     referral_fee_percent: float = 15.0
+    # How long fetched API data is reused before an ASIN is queried again
+    paapi_ttl_seconds: int = 120
+    keepa_ttl_seconds: int = 3600
 
 
 class ServerSettings(BaseSettings):
@@ -86,13 +102,12 @@ class Settings(BaseSettings):
         return cls(**yaml_data)
 
 
+@dataclass(slots=True)
 class WatchlistItem:
-    def __init__(self, asin: str = "", keywords: str = "", label: str = "",
-                 target_buy_price: float | None = None):
-        self.asin = asin
-        self.keywords = keywords
-        self.label = label
-        self.target_buy_price = target_buy_price
+    asin: str = ""
+    keywords: str = ""
+    label: str = ""
+    target_buy_price: float | None = None
 
 
 def load_watchlist() -> list[WatchlistItem]:
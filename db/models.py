@@ -1,12 +1,35 @@
 from __future__ import annotations
 
-from datetime import datetime
-
 from sqlalchemy import (
     Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text,
     UniqueConstraint, Index,
 )
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class utc_now(FunctionElement):
+    """Current UTC time, evaluated by the database."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utc_now)
+def _utc_now_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utc_now, "sqlite")
+def _utc_now_sqlite(element, compiler, **kw):
+    # CURRENT_TIMESTAMP only has second resolution in SQLite
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+@compiles(utc_now, "postgresql")
+def _utc_now_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
 
 
 class Base(DeclarativeBase):
@@ -26,8 +49,8 @@ class Product(Base):
     target_buy_price = Column(Float, nullable=True)
     source = Column(String(50), default="manual")
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utc_now(), server_default=utc_now())
+    updated_at = Column(DateTime, default=utc_now(), server_default=utc_now(), onupdate=utc_now())
 
     price_records = relationship("PriceRecord", back_populates="product", cascade="all, delete-orphan")
     deals = relationship("Deal", back_populates="product", cascade="all, delete-orphan")
@@ -38,7 +61,7 @@ class PriceRecord(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     asin = Column(String(20), ForeignKey("products.asin"), nullable=False, index=True)
-    checked_at = Column(DateTime, default=datetime.utcnow, index=True)
+    checked_at = Column(DateTime, default=utc_now(), server_default=utc_now(), index=True)
     current_price = Column(Float, nullable=True)
     list_price = Column(Float, nullable=True)
     buy_box_price = Column(Float, nullable=True)
@@ -57,7 +80,14 @@ class PriceRecord(Base):
     product = relationship("Product", back_populates="price_records")
 
     __table_args__ = (
-        Index("ix_price_records_asin_checked", "asin", "checked_at"),
+        Index("ix_price_records_asin_checked", "asin", checked_at.desc()),
+        # Covers the "latest price per ASIN" lookups without a heap fetch
+        Index(
+            "ix_price_records_latest",
+            "asin",
+            "checked_at",
+            postgresql_include=["current_price", "buy_box_price", "avg_30d"],
+        ).ddl_if(dialect="postgresql"),
     )
 
 
@@ -73,7 +103,7 @@ class Deal(Base):
     estimated_profit = Column(Float, nullable=True)
     estimated_roi = Column(Float, nullable=True)
     is_active = Column(Boolean, default=True)
-    detected_at = Column(DateTime, default=datetime.utcnow)
+    detected_at = Column(DateTime, default=utc_now(), server_default=utc_now())
     dismissed_at = Column(DateTime, nullable=True)
 
     product = relationship("Product", back_populates="deals")
@@ -88,7 +118,7 @@ class Alert(Base):
     deal_id = Column(Integer, ForeignKey("deals.id"), nullable=True)
     alert_type = Column(String(50), nullable=False)
     message = Column(Text, default="")
-    sent_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, default=utc_now(), server_default=utc_now())
 
     deal = relationship("Deal", back_populates="alerts")
 
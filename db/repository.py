@@ -1,22 +1,73 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 from typing import Sequence
 
-from sqlalchemy import select, update
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, joinedload
 
-from db.models import Product, PriceRecord, Deal, Alert
+from db.models import Product, PriceRecord, Deal, Alert, utc_now
+
+# Dialect-specific INSERT constructs that support ON CONFLICT clauses
+_CONFLICT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def _conflict_insert(session: Session):
+    return _CONFLICT_INSERTS[session.get_bind().dialect.name]
+
+
+# Column sets for read paths that return plain rows instead of ORM objects
+_PRODUCT_ROW_COLS = (
+    Product.asin, Product.title, Product.brand, Product.category,
+    Product.label, Product.target_buy_price, Product.is_active,
+)
+_LATEST_PRICE_ROW_COLS = (
+    PriceRecord.current_price, PriceRecord.list_price, PriceRecord.buy_box_price,
+    PriceRecord.savings_percent, PriceRecord.sales_rank,
+    PriceRecord.avg_30d, PriceRecord.avg_90d, PriceRecord.avg_180d,
+    PriceRecord.all_time_low, PriceRecord.all_time_high, PriceRecord.checked_at,
+)
+_DEAL_ROW_COLS = (
+    Deal.asin, Deal.deal_type, Deal.trigger_price, Deal.reference_price,
+    Deal.drop_percent, Deal.estimated_profit, Deal.estimated_roi, Deal.detected_at,
+)
 
 
 class ProductRepository:
     def __init__(self, session: Session):
         self.session = session
 
+    # Statement builders are shared with the async routes, which execute
+    # them on an AsyncSession.
+
+    @staticmethod
+    def get_by_asin_stmt(asin: str) -> Select:
+        return select(Product).where(Product.asin == asin)
+
+    @staticmethod
+    def count_active_stmt() -> Select:
+        return select(func.count()).select_from(Product).where(Product.is_active.is_(True))
+
+    @staticmethod
+    def list_all_stmt(skip: int = 0, limit: int = 100) -> Select:
+        return select(Product).offset(skip).limit(limit)
+
     def get_by_asin(self, asin: str) -> Product | None:
-        return self.session.execute(
-            select(Product).where(Product.asin == asin)
-        ).scalar_one_or_none()
+        return self.session.execute(self.get_by_asin_stmt(asin)).scalar_one_or_none()
+
+    def get_targets_by_asins(self, asins: list[str]) -> dict[str, float | None]:
+        """Map of asin to target_buy_price for the given ASINs that exist."""
+        if not asins:
+            return {}
+        rows = self.session.execute(
+            select(Product.asin, Product.target_buy_price).where(Product.asin.in_(asins))
+        ).all()
+        return dict(rows)
 
     def get_all_active(self) -> Sequence[Product]:
         return self.session.execute(
@@ -24,9 +75,30 @@ class ProductRepository:
         ).scalars().all()
 
     def list_all(self, skip: int = 0, limit: int = 100) -> Sequence[Product]:
-        return self.session.execute(
-            select(Product).offset(skip).limit(limit)
-        ).scalars().all()
+        return self.session.execute(self.list_all_stmt(skip, limit)).scalars().all()
+
+    def list_rows_with_latest(self, skip: int = 0, limit: int = 100) -> Sequence[Row]:
+        """Product rows outer-joined to their latest price record.
+
+        Columns are the product fields, ``latest_id`` (None for products with
+        no price records yet), then the price fields, all in the order of the
+        ``_*_ROW_COLS`` tuples above.
+        """
+        latest_id = (
+            select(PriceRecord.id)
+            .where(PriceRecord.asin == Product.asin)
+            .order_by(PriceRecord.checked_at.desc())
+            .limit(1)
+            .correlate(Product)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(*_PRODUCT_ROW_COLS, PriceRecord.id.label("latest_id"), *_LATEST_PRICE_ROW_COLS)
+            .outerjoin(PriceRecord, PriceRecord.id == latest_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return self.session.execute(stmt).all()
 
     def create(self, **kwargs) -> Product:
         product = Product(**kwargs)
@@ -47,6 +119,29 @@ class ProductRepository:
             return product
         return self.create(asin=asin, **kwargs)
 
+    def upsert_many(self, rows: list[dict]) -> Sequence[Product]:
+        """Insert or update many products in one INSERT ... ON CONFLICT.
+
+        Like upsert, None values leave the stored column unchanged. Every row
+        must have the same keys. Products already in the session are
+        refreshed with the new values.
+        """
+        if not rows:
+            return []
+        stmt = _conflict_insert(self.session)(Product)
+        set_ = {
+            key: func.coalesce(stmt.excluded[key], Product.__table__.c[key])
+            for key in rows[0]
+            if key != "asin"
+        }
+        set_["updated_at"] = utc_now()
+        stmt = stmt.on_conflict_do_update(index_elements=["asin"], set_=set_).returning(Product)
+        products = self.session.scalars(
+            stmt, rows, execution_options={"populate_existing": True, "render_nulls": True}
+        ).all()
+        self.session.commit()
+        return products
+
     def deactivate(self, asin: str) -> bool:
         result = self.session.execute(
             update(Product).where(Product.asin == asin).values(is_active=False)
@@ -59,20 +154,60 @@ class PriceRecordRepository:
     def __init__(self, session: Session):
         self.session = session
 
+    @staticmethod
+    def get_history_stmt(asin: str, limit: int = 100) -> Select:
+        return (
+            select(PriceRecord)
+            .where(PriceRecord.asin == asin)
+            .order_by(PriceRecord.checked_at.desc())
+            .limit(limit)
+        )
+
+    @staticmethod
+    def get_stats_stmt(asin: str) -> Select:
+        return select(
+            func.min(PriceRecord.current_price),
+            func.max(PriceRecord.current_price),
+            func.avg(PriceRecord.current_price),
+            func.count(),
+        ).where(PriceRecord.asin == asin, PriceRecord.current_price.isnot(None))
+
     def add(self, **kwargs) -> PriceRecord:
         record = PriceRecord(**kwargs)
         self.session.add(record)
         self.session.commit()
-        self.session.refresh(record)
         return record
 
+    def add_many(self, rows: list[dict]):
+        """Insert many price records with a single executemany and commit."""
+        if not rows:
+            return
+        self.session.execute(insert(PriceRecord), rows)
+        self.session.commit()
+
     def get_history(self, asin: str, limit: int = 100) -> Sequence[PriceRecord]:
-        return self.session.execute(
+        return self.session.execute(self.get_history_stmt(asin, limit)).scalars().all()
+
+    def get_latest_for_asins(self, asins: list[str]) -> dict[str, PriceRecord]:
+        """Return the most recent record per ASIN in a single windowed query."""
+        if not asins:
+            return {}
+        ranked = (
+            select(
+                PriceRecord.id,
+                func.row_number()
+                .over(partition_by=PriceRecord.asin, order_by=PriceRecord.checked_at.desc())
+                .label("rn"),
+            )
+            .where(PriceRecord.asin.in_(asins))
+            .subquery()
+        )
+        rows = self.session.execute(
             select(PriceRecord)
-            .where(PriceRecord.asin == asin)
-            .order_by(PriceRecord.checked_at.desc())
-            .limit(limit)
+            .join(ranked, PriceRecord.id == ranked.c.id)
+            .where(ranked.c.rn == 1)
         ).scalars().all()
+        return {r.asin: r for r in rows}
 
     def get_latest(self, asin: str) -> PriceRecord | None:
         return self.session.execute(
@@ -87,13 +222,44 @@ class DealRepository:
     def __init__(self, session: Session):
         self.session = session
 
+    @staticmethod
+    def get_active_stmt(
+        deal_type: str | None = None,
+        min_roi: float | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Select:
+        stmt = (
+            select(Deal)
+            .options(joinedload(Deal.product))
+            .where(Deal.is_active.is_(True))
+        )
+        if deal_type:
+            stmt = stmt.where(Deal.deal_type == deal_type)
+        if min_roi is not None:
+            stmt = stmt.where(Deal.estimated_roi >= min_roi)
+        return stmt.order_by(Deal.detected_at.desc()).offset(skip).limit(limit)
+
+    @staticmethod
+    def count_active_stmt() -> Select:
+        return select(func.count()).select_from(Deal).where(Deal.is_active.is_(True))
+
     def create(self, **kwargs) -> Deal:
         deal = Deal(**kwargs)
         self.session.add(deal)
         self.session.commit()
-        self.session.refresh(deal)
         return deal
 
+    def create_many(self, rows: list[dict]) -> Sequence[Deal]:
+        """Insert many deals in one batched INSERT and return them in row order."""
+        if not rows:
+            return []
+        deals = self.session.scalars(
+            insert(Deal).returning(Deal, sort_by_parameter_order=True), rows
+        ).all()
+        self.session.commit()
+        return deals
+
     def get_active(
         self,
         deal_type: str | None = None,
@@ -101,14 +267,17 @@ class DealRepository:
         skip: int = 0,
         limit: int = 100,
     ) -> Sequence[Deal]:
-        stmt = select(Deal).where(Deal.is_active.is_(True))
-        if deal_type:
-            stmt = stmt.where(Deal.deal_type == deal_type)
-        if min_roi is not None:
-            stmt = stmt.where(Deal.estimated_roi >= min_roi)
-        stmt = stmt.order_by(Deal.detected_at.desc()).offset(skip).limit(limit)
+        stmt = self.get_active_stmt(deal_type, min_roi, skip, limit)
         return self.session.execute(stmt).scalars().all()
 
+    def get_active_rows(self) -> Sequence[Row]:
+        """All active deals as plain rows, newest first."""
+        return self.session.execute(
+            select(*_DEAL_ROW_COLS)
+            .where(Deal.is_active.is_(True))
+            .order_by(Deal.detected_at.desc())
+        ).all()
+
     def dismiss(self, deal_id: int) -> bool:
         result = self.session.execute(
             update(Deal)
@@ -126,6 +295,16 @@ class DealRepository:
         )
         self.session.commit()
 
+    def deactivate_for_asins(self, asins: list[str]):
+        if not asins:
+            return
+        self.session.execute(
+            update(Deal)
+            .where(Deal.asin.in_(asins), Deal.is_active.is_(True))
+            .values(is_active=False, dismissed_at=datetime.utcnow())
+        )
+        self.session.commit()
+
 
 class AlertRepository:
     def __init__(self, session: Session):
@@ -135,18 +314,24 @@ class AlertRepository:
         alert = Alert(**kwargs)
         self.session.add(alert)
         self.session.commit()
-        self.session.refresh(alert)
         return alert
 
-    def exists(self, asin: str, deal_id: int, alert_type: str) -> bool:
-        result = self.session.execute(
-            select(Alert).where(
-                Alert.asin == asin,
-                Alert.deal_id == deal_id,
-                Alert.alert_type == alert_type,
-            )
-        ).scalar_one_or_none()
-        return result is not None
+    def create_many_if_absent(self, rows: list[dict]) -> set[tuple[str, int | None, str]]:
+        """Insert alerts, skipping any that already exist for (asin, deal_id, alert_type).
+
+        Relies on the uq_alert_dedup constraint. Returns the
+        (asin, deal_id, alert_type) keys of the rows actually inserted.
+        """
+        if not rows:
+            return set()
+        stmt = (
+            _conflict_insert(self.session)(Alert)
+            .on_conflict_do_nothing(index_elements=["asin", "deal_id", "alert_type"])
+            .returning(Alert.asin, Alert.deal_id, Alert.alert_type)
+        )
+        inserted = {tuple(row) for row in self.session.execute(stmt, rows)}
+        self.session.commit()
+        return inserted
 
     def get_for_asin(self, asin: str, limit: int = 50) -> Sequence[Alert]:
         return self.session.execute(
@@ -155,3 +340,30 @@ class AlertRepository:
             .order_by(Alert.sent_at.desc())
             .limit(limit)
         ).scalars().all()
+
+
+class UnitOfWork:
+    """Per-request bundle of repositories sharing one session.
+
+    Repositories are created on first access, so a request only pays for
+    the ones it uses.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @cached_property
+    def products(self) -> ProductRepository:
+        return ProductRepository(self.session)
+
+    @cached_property
+    def prices(self) -> PriceRecordRepository:
+        return PriceRecordRepository(self.session)
+
+    @cached_property
+    def deals(self) -> DealRepository:
+        return DealRepository(self.session)
+
+    @cached_property
+    def alerts(self) -> AlertRepository:
+        return AlertRepository(self.session)
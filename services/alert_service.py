@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Sequence
 
 from sqlalchemy.orm import Session
 
@@ -9,6 +10,15 @@ from db.repository import AlertRepository
 
 logger = logging.getLogger(__name__)
 
+# Deal fields included in alert messages, in order, with their formatters
+_FIELDS = (
+    ("trigger_price", "Price: ${:.2f}".format),
+    ("reference_price", "Reference: ${:.2f}".format),
+    ("drop_percent", "Drop: {:.1f}%".format),
+    ("estimated_profit", "Est. Profit: ${:.2f}".format),
+    ("estimated_roi", "ROI: {:.1f}%".format),
+)
+
 
 class AlertService:
     """Threshold checking, deduplication, and logging for deal alerts."""
@@ -16,39 +26,29 @@ class AlertService:
     def __init__(self, session: Session):
         self.alert_repo = AlertRepository(session)
 
-    def process_deal(self, asin: str, deal: Deal):
-        """Create an alert for a deal if not already sent."""
-        alert_type = f"{deal.deal_type}_detected"
-
-        if self.alert_repo.exists(asin, deal.id, alert_type):
-            logger.debug(f"Alert already sent for {asin} deal #{deal.id}")
-            return
-
-        message = self._format_message(asin, deal)
-        self.alert_repo.create(
-            asin=asin,
-            deal_id=deal.id,
-            alert_type=alert_type,
-            message=message,
-        )
-        logger.info(f"DEAL ALERT [{deal.deal_type}] {asin}: {message}")
+    def process_deals_batch(self, pending: Sequence[tuple[str, Deal]]):
+        """Create alerts for many deals with a single INSERT and commit."""
+        rows = [
+            {
+                "asin": asin,
+                "deal_id": deal.id,
+                "alert_type": f"{deal.deal_type}_detected",
+                "message": self._format_message(asin, deal),
+            }
+            for asin, deal in pending
+        ]
+        inserted = self.alert_repo.create_many_if_absent(rows)
+
+        for (asin, deal), row in zip(pending, rows):
+            if (asin, deal.id, row["alert_type"]) not in inserted:
+                logger.debug(f"Alert already sent for {asin} deal #{deal.id}")
+                continue
+            logger.info(f"DEAL ALERT [{deal.deal_type}] {asin}: {row['message']}")
 
     def _format_message(self, asin: str, deal: Deal) -> str:
         parts = [f"{deal.deal_type.upper()} for {asin}"]
-
-        if deal.trigger_price is not None:
-            parts.append(f"Price: ${deal.trigger_price:.2f}")
-
-        if deal.reference_price is not None:
-            parts.append(f"Reference: ${deal.reference_price:.2f}")
-
-        if deal.drop_percent is not None:
-            parts.append(f"Drop: {deal.drop_percent:.1f}%")
-
-        if deal.estimated_profit is not None:
-            parts.append(f"Est. Profit: ${deal.estimated_profit:.2f}")
-
-        if deal.estimated_roi is not None:
-            parts.append(f"ROI: {deal.estimated_roi:.1f}%")
-
+        for attr, fmt in _FIELDS:
+            value = getattr(deal, attr)
+            if value is not None:
+                parts.append(fmt(value))
         return " | ".join(parts)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Callable
+
+from cachetools import TTLCache
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class AsinCache:
+    """Thread-safe per-ASIN TTL cache of parsed API items.
+
+    Items are the dicts returned by the clients and must carry an ``asin``
+    key. Cached items are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, name: str, ttl: float, maxsize: int = 100_000):
+        self.name = name
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def partition(self, asins: list[str]) -> tuple[list[dict[str, Any]], list[str]]:
+        """Split ASINs into cached items and the ASINs that still need fetching."""
+        fresh = []
+        stale = []
+        with self._lock:
+            for asin in asins:
+                item = self._cache.get(asin)
+                if item is None:
+                    stale.append(asin)
+                else:
+                    fresh.append(item)
+        logger.debug(f"{self.name} cache: {len(fresh)} fresh, {len(stale)} to fetch")
+        return fresh, stale
+
+    def put_many(self, items: list[dict[str, Any]]):
+        with self._lock:
+            for item in items:
+                self._cache[item["asin"]] = item
+
+    def invalidate(self, asin: str):
+        with self._lock:
+            self._cache.pop(asin, None)
+
+    def fetch(
+        self, asins: list[str], fetcher: Callable[[list[str]], list[dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Return items for ``asins``, calling ``fetcher`` only for uncached ones."""
+        items, stale = self.partition(asins)
+        if stale:
+            fetched = fetcher(stale)
+            self.put_many(fetched)
+            items.extend(fetched)
+        return items
+
+
+@lru_cache(maxsize=1)
+def get_paapi_cache() -> AsinCache:
+    return AsinCache("PA-API", ttl=get_settings().monitoring.paapi_ttl_seconds)
+
+
+@lru_cache(maxsize=1)
+def get_keepa_cache() -> AsinCache:
+    return AsinCache("Keepa", ttl=get_settings().monitoring.keepa_ttl_seconds)
@@ -2,19 +2,31 @@ from __future__ import annotations
 
 import csv
 import io
-import json
 import logging
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+import orjson
 from sqlalchemy.orm import Session
 
 from config.settings import get_settings
-from db.repository import ProductRepository, PriceRecordRepository, DealRepository
+from db.repository import ProductRepository, DealRepository
 
 logger = logging.getLogger(__name__)
 
+# Latest-price fields in CSV column order; checked_at must stay last
+_LATEST_COLS = (
+    "current_price", "list_price", "buy_box_price",
+    "savings_percent", "sales_rank",
+    "avg_30d", "avg_90d", "avg_180d",
+    "all_time_low", "all_time_high",
+    "checked_at",
+)
+_LATEST_VALUES = itemgetter(*_LATEST_COLS)
+_NO_LATEST = ("",) * len(_LATEST_COLS)
+
 
 class ExportService:
     """JSON and CSV export of products, prices, and deals."""
@@ -22,127 +34,110 @@ class ExportService:
     def __init__(self, session: Session):
         self.session = session
         self.product_repo = ProductRepository(session)
-        self.price_repo = PriceRecordRepository(session)
         self.deal_repo = DealRepository(session)
         self.output_dir = Path(get_settings().export.output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def export_json(self, save_to_file: bool = False) -> str:
-        """Export all monitored data as JSON."""
+    def export_json(self, save_to_file: bool = False, as_obj: bool = False) -> str | dict[str, Any]:
+        """Export all monitored data as JSON.
+
+        With ``save_to_file=True`` the JSON is written to disk and the file
+        path is returned. Otherwise ``as_obj=True`` returns the export dict
+        instead of a JSON string, so callers that serialize it themselves
+        skip a parse step.
+        """
         data = self._build_export_data()
-        json_str = json.dumps(data, indent=2, default=str)
+        if as_obj and not save_to_file:
+            return data
+
+        json_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2)
 
         if save_to_file:
-            filename = f"export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-            path = self.output_dir / filename
-            path.write_text(json_str)
+            path = self._output_path("json")
+            path.write_bytes(json_bytes)
             logger.info(f"JSON exported to {path}")
+            return str(path)
 
-        return json_str
+        return json_bytes.decode()
 
     def export_csv(self, save_to_file: bool = False) -> str:
-        """Export price records as CSV."""
-        data = self._build_export_data()
-        output = io.StringIO()
-        writer = csv.writer(output)
+        """Export price records as CSV.
+
+        With ``save_to_file=True`` rows are streamed straight to disk and the
+        file path is returned instead of the CSV text, as with export_json.
+        """
+        if save_to_file:
+            path = self._output_path("csv")
+            with path.open("w", newline="", buffering=1 << 20) as f:
+                f.writelines(self.iter_csv_rows())
+            logger.info(f"CSV exported to {path}")
+            return str(path)
+
+        return "".join(self.iter_csv_rows())
+
+    def iter_csv_rows(self) -> Iterator[str]:
+        """Yield the CSV export one line at a time."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def flush() -> str:
+            line = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return line
 
         # Header
-        writer.writerow([
-            "asin", "title", "brand", "category", "label",
-            "current_price", "list_price", "buy_box_price",
-            "savings_percent", "sales_rank",
-            "avg_30d", "avg_90d", "avg_180d",
-            "all_time_low", "all_time_high",
-            "checked_at", "active_deals",
-        ])
-
-        for product in data["products"]:
-            latest = product.get("latest_price", {})
-            deals = product.get("active_deals", [])
+        writer.writerow(("asin", "title", "brand", "category", "label", *_LATEST_COLS, "active_deals"))
+        yield flush()
+
+        for product in self._iter_product_data():
+            latest = product["latest_price"]
+            *prices, checked_at = _LATEST_VALUES(latest) if latest else _NO_LATEST
             deal_str = "; ".join(
-                f"{d['deal_type']}({d.get('drop_percent', '')}%)" for d in deals
+                f"{d['deal_type']}({d.get('drop_percent', '')}%)" for d in product["active_deals"]
             )
-            writer.writerow([
+            writer.writerow((
                 product["asin"],
                 product["title"],
                 product["brand"],
                 product["category"],
                 product["label"],
-                latest.get("current_price", ""),
-                latest.get("list_price", ""),
-                latest.get("buy_box_price", ""),
-                latest.get("savings_percent", ""),
-                latest.get("sales_rank", ""),
-                latest.get("avg_30d", ""),
-                latest.get("avg_90d", ""),
-                latest.get("avg_180d", ""),
-                latest.get("all_time_low", ""),
-                latest.get("all_time_high", ""),
-                latest.get("checked_at", ""),
+                *prices,
+                checked_at.isoformat() if checked_at else "",
                 deal_str,
-            ])
+            ))
+            yield flush()
 
-        csv_str = output.getvalue()
-
-        if save_to_file:
-            filename = f"export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
-            path = self.output_dir / filename
-            path.write_text(csv_str)
-            logger.info(f"CSV exported to {path}")
-
-        return csv_str
+    def _output_path(self, extension: str) -> Path:
+        # Created on first save rather than per instance; API requests
+        # never write to disk
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return self.output_dir / f"export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.{extension}"
 
     def _build_export_data(self) -> dict[str, Any]:
-        products = self.product_repo.list_all(limit=10000)
-        result: dict[str, Any] = {
-            "exported_at": datetime.utcnow().isoformat(),
+        products = list(self._iter_product_data())
+        return {
+            "exported_at": datetime.utcnow(),
             "total_products": len(products),
-            "products": [],
+            "products": products,
         }
 
-        for product in products:
-            latest = self.price_repo.get_latest(product.asin)
-            deals = self.deal_repo.get_active(skip=0, limit=100)
-            active_deals = [d for d in deals if d.asin == product.asin]
-
-            product_data: dict[str, Any] = {
-                "asin": product.asin,
-                "title": product.title,
-                "brand": product.brand,
-                "category": product.category,
-                "label": product.label,
-                "target_buy_price": product.target_buy_price,
-                "is_active": product.is_active,
-                "latest_price": {},
-                "active_deals": [],
+    def _iter_product_data(self) -> Iterator[dict[str, Any]]:
+        """Yield one export dict per product."""
+        deals_by_asin: dict[str, list[dict[str, Any]]] = {}
+        for row in self.deal_repo.get_active_rows():
+            deal = row._asdict()
+            deals_by_asin.setdefault(deal.pop("asin"), []).append(deal)
+
+        for row in self.product_repo.list_rows_with_latest(limit=10000):
+            asin, title, brand, category, label, target, is_active, latest_id, *latest = row
+            yield {
+                "asin": asin,
+                "title": title,
+                "brand": brand,
+                "category": category,
+                "label": label,
+                "target_buy_price": target,
+                "is_active": is_active,
+                "latest_price": dict(zip(_LATEST_COLS, latest)) if latest_id is not None else {},
+                "active_deals": deals_by_asin.get(asin, []),
             }
-
-            if latest:
-                product_data["latest_price"] = {
-                    "current_price": latest.current_price,
-                    "list_price": latest.list_price,
-                    "buy_box_price": latest.buy_box_price,
-                    "savings_percent": latest.savings_percent,
-                    "sales_rank": latest.sales_rank,
-                    "avg_30d": latest.avg_30d,
-                    "avg_90d": latest.avg_90d,
-                    "avg_180d": latest.avg_180d,
-                    "all_time_low": latest.all_time_low,
-                    "all_time_high": latest.all_time_high,
-                    "checked_at": latest.checked_at.isoformat() if latest.checked_at else None,
-                }
-
-            for deal in active_deals:
-                product_data["active_deals"].append({
-                    "deal_type": deal.deal_type,
-                    "trigger_price": deal.trigger_price,
-                    "reference_price": deal.reference_price,
-                    "drop_percent": deal.drop_percent,
-                    "estimated_profit": deal.estimated_profit,
-                    "estimated_roi": deal.estimated_roi,
-                    "detected_at": deal.detected_at.isoformat() if deal.detected_at else None,
-                })
-
-            result["products"].append(product_data)
-
-        return result
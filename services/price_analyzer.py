@@ -2,14 +2,99 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache
+from typing import Any, Sequence
 
 from config.settings import get_settings
 
+try:
+    import ahocorasick  # optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Keepa averages checked for below_average deals, in priority order
+_AVG_PERIODS = ("avg_30d", "avg_90d", "avg_180d")
+
+# Deal column values for one detected deal, without the asin
+DealRow = dict[str, Any]
+
+
+def _build_keyword_automaton(keywords: Sequence[str]):
+    """Aho-Corasick automaton matching any of ``keywords``, if available."""
+    if ahocorasick is None or not keywords:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+@dataclass(frozen=True, slots=True)
+class _AnalyzerConfig:
+    drop_threshold: float
+    min_savings: float
+    target_roi: float
+    fba_fee_pct: float
+    referral_fee_pct: float
+    # Titles are lowercased before matching, so keywords must be too
+    clearance_keywords: tuple[str, ...]
+    keyword_automaton: Any = field(default=None, compare=False)
+
+
+@lru_cache(maxsize=1)
+def _analyzer_config() -> _AnalyzerConfig:
+    """Analyzer thresholds derived from settings, built once per process."""
+    settings = get_settings().monitoring
+    keywords = tuple(kw.lower() for kw in settings.clearance_keywords)
+    return _AnalyzerConfig(
+        drop_threshold=settings.price_drop_threshold_percent,
+        min_savings=settings.min_savings_percent,
+        target_roi=settings.target_roi_percent,
+        fba_fee_pct=settings.fba_fee_percent / 100.0,
+        referral_fee_pct=settings.referral_fee_percent / 100.0,
+        clearance_keywords=keywords,
+        keyword_automaton=_build_keyword_automaton(keywords),
+    )
 
-@dataclass
+
+@lru_cache(maxsize=32768)
+def _title_has_clearance_keyword(title: str) -> bool:
+    """Clearance keyword check, memoized per title.
+
+    Titles rarely change between checks, so most ticks skip lowercasing
+    and scanning them entirely.
+    """
+    cfg = _analyzer_config()
+    if not title.islower():
+        title = title.lower()
+    # One pass over the title regardless of keyword count
+    if cfg.keyword_automaton is not None:
+        return next(cfg.keyword_automaton.iter(title), None) is not None
+    return any(kw in title for kw in cfg.clearance_keywords)
+
+
+def _deal_row(
+    deal_type: str,
+    trigger_price: float | None = None,
+    reference_price: float | None = None,
+    drop_percent: float | None = None,
+    estimated_profit: float | None = None,
+    estimated_roi: float | None = None,
+) -> DealRow:
+    return {
+        "deal_type": deal_type,
+        "trigger_price": trigger_price,
+        "reference_price": reference_price,
+        "drop_percent": drop_percent,
+        "estimated_profit": estimated_profit,
+        "estimated_roi": estimated_roi,
+    }
+
+
+@dataclass(slots=True)
 class DealSignal:
     deal_type: str
     trigger_price: float | None = None
@@ -19,7 +104,8 @@ class DealSignal:
     estimated_roi: float | None = None
 
 
-@dataclass
+# Frozen because _estimate_profit hands the same cached instance to every caller
+@dataclass(frozen=True, slots=True)
 class ProfitEstimate:
     sale_price: float
     cost: float
@@ -31,17 +117,35 @@ class ProfitEstimate:
     margin: float
 
 
+@lru_cache(maxsize=4096, typed=True)
+def _estimate_profit(
+    sale_price: float, cost: float, referral_fee_pct: float, fba_fee_pct: float
+) -> ProfitEstimate:
+    """Profit after fees; memoized since catalogs repeat the same price pairs."""
+    referral_fee = round(sale_price * referral_fee_pct, 2)
+    fba_fee = round(sale_price * fba_fee_pct, 2)
+    total_fees = round(referral_fee + fba_fee, 2)
+    profit = round(sale_price - cost - total_fees, 2)
+    roi = round((profit / cost) * 100, 1) if cost > 0 else 0.0
+    margin = round((profit / sale_price) * 100, 1) if sale_price > 0 else 0.0
+
+    return ProfitEstimate(
+        sale_price=sale_price,
+        cost=cost,
+        referral_fee=referral_fee,
+        fba_fee=fba_fee,
+        total_fees=total_fees,
+        profit=profit,
+        roi=roi,
+        margin=margin,
+    )
+
+
 class PriceAnalyzer:
     """Stateless deal detection and profit estimation."""
 
     def __init__(self):
-        settings = get_settings().monitoring
-        self.drop_threshold = settings.price_drop_threshold_percent
-        self.clearance_keywords = settings.clearance_keywords
-        self.min_savings = settings.min_savings_percent
-        self.target_roi = settings.target_roi_percent
-        self.fba_fee_pct = settings.fba_fee_percent / 100.0
-        self.referral_fee_pct = settings.referral_fee_percent / 100.0
+        self._cfg = _analyzer_config()
 
     def detect_deals(
         self,
@@ -49,33 +153,38 @@ class PriceAnalyzer:
         previous: dict[str, Any] | None = None,
         keepa_data: dict[str, Any] | None = None,
         target_buy_price: float | None = None,
-    ) -> list[DealSignal]:
-        """Analyze price data and return any detected deal signals."""
-        signals: list[DealSignal] = []
+    ) -> list[DealRow]:
+        """Analyze price data and return any detected deals.
+
+        Each deal is a dict of Deal column values (without ``asin``), ready
+        for DealRepository.create_many.
+        """
+        signals: list[DealRow] = []
         price = current.get("current_price")
         if price is None:
             return signals
+        cfg = self._cfg
+        threshold = cfg.drop_threshold
 
         # 1. Price drop vs previous check
         if previous:
             prev_price = previous.get("current_price")
             if prev_price and prev_price > 0:
                 drop_pct = ((prev_price - price) / prev_price) * 100
-                if drop_pct >= self.drop_threshold:
-                    signals.append(DealSignal(
+                if drop_pct >= threshold:
+                    signals.append(_deal_row(
                         deal_type="price_drop",
                         trigger_price=price,
                         reference_price=prev_price,
                         drop_percent=round(drop_pct, 1),
                     ))
 
-        # 2. Clearance detection
-        title = current.get("title", "").lower()
-        is_clearance_keyword = any(kw in title for kw in self.clearance_keywords)
+        # 2. Clearance detection; the title is only scanned if savings alone
+        # don't qualify
         savings = current.get("savings_percent") or 0
-        if is_clearance_keyword or savings >= self.min_savings:
+        if savings >= cfg.min_savings or self._has_clearance_keyword(current.get("title") or ""):
             list_price = current.get("list_price") or price
-            signals.append(DealSignal(
+            signals.append(_deal_row(
                 deal_type="clearance",
                 trigger_price=price,
                 reference_price=list_price,
@@ -84,12 +193,12 @@ class PriceAnalyzer:
 
         if keepa_data:
             # 3. Below average
-            for period in ["avg_30d", "avg_90d", "avg_180d"]:
+            for period in _AVG_PERIODS:
                 avg = keepa_data.get(period)
                 if avg and avg > 0 and price < avg:
                     drop = ((avg - price) / avg) * 100
-                    if drop >= self.drop_threshold:
-                        signals.append(DealSignal(
+                    if drop >= threshold:
+                        signals.append(_deal_row(
                             deal_type="below_average",
                             trigger_price=price,
                             reference_price=avg,
@@ -100,7 +209,7 @@ class PriceAnalyzer:
             # 4. All-time low
             atl = keepa_data.get("all_time_low")
             if atl and atl > 0 and price <= atl:
-                signals.append(DealSignal(
+                signals.append(_deal_row(
                     deal_type="all_time_low",
                     trigger_price=price,
                     reference_price=atl,
@@ -109,40 +218,50 @@ class PriceAnalyzer:
 
         # 5. Margin opportunity
         if target_buy_price is not None and price <= target_buy_price:
-            # Use list price or a Keepa avg as the expected resale price
-            resale_price = current.get("list_price")
-            if not resale_price and keepa_data:
-                resale_price = keepa_data.get("avg_90d")
-            if resale_price and resale_price > price:
-                estimate = self.estimate_profit(resale_price, price)
-                if estimate.roi >= self.target_roi:
-                    signals.append(DealSignal(
-                        deal_type="margin_opportunity",
-                        trigger_price=price,
-                        reference_price=resale_price,
-                        drop_percent=round(((resale_price - price) / resale_price) * 100, 1),
-                        estimated_profit=estimate.profit,
-                        estimated_roi=estimate.roi,
-                    ))
+            signal = self._margin_row(current, keepa_data, price)
+            if signal:
+                signals.append(signal)
 
         return signals
 
+    def detect_deal_signals(
+        self,
+        current: dict[str, Any],
+        previous: dict[str, Any] | None = None,
+        keepa_data: dict[str, Any] | None = None,
+        target_buy_price: float | None = None,
+    ) -> list[DealSignal]:
+        """detect_deals, with each deal wrapped in a DealSignal."""
+        rows = self.detect_deals(current, previous, keepa_data, target_buy_price)
+        return [DealSignal(**row) for row in rows]
+
+    def _margin_row(
+        self, current: dict[str, Any], keepa_data: dict[str, Any] | None, price: float
+    ) -> DealRow | None:
+        """Margin opportunity for a price already at or below the target buy price."""
+        # Use list price or a Keepa avg as the expected resale price
+        resale_price = current.get("list_price")
+        if not resale_price and keepa_data:
+            resale_price = keepa_data.get("avg_90d")
+        if resale_price and resale_price > price:
+            estimate = self.estimate_profit(resale_price, price)
+            if estimate.roi >= self._cfg.target_roi:
+                return _deal_row(
+                    deal_type="margin_opportunity",
+                    trigger_price=price,
+                    reference_price=resale_price,
+                    drop_percent=round(((resale_price - price) / resale_price) * 100, 1),
+                    estimated_profit=estimate.profit,
+                    estimated_roi=estimate.roi,
+                )
+        return None
+
+    def _has_clearance_keyword(self, title: str) -> bool:
+        if not self._cfg.clearance_keywords:
+            return False
+        return _title_has_clearance_keyword(title)
+
     def estimate_profit(self, sale_price: float, cost: float) -> ProfitEstimate:
         """Calculate estimated profit after Amazon fees."""
-        referral_fee = round(sale_price * self.referral_fee_pct, 2)
-        fba_fee = round(sale_price * self.fba_fee_pct, 2)
-        total_fees = round(referral_fee + fba_fee, 2)
-        profit = round(sale_price - cost - total_fees, 2)
-        roi = round((profit / cost) * 100, 1) if cost > 0 else 0.0
-        margin = round((profit / sale_price) * 100, 1) if sale_price > 0 else 0.0
-
-        return ProfitEstimate(
-            sale_price=sale_price,
-            cost=cost,
-            referral_fee=referral_fee,
-            fba_fee=fba_fee,
-            total_fees=total_fees,
-            profit=profit,
-            roi=roi,
-            margin=margin,
-        )
+        cfg = self._cfg
+        return _estimate_profit(sale_price, cost, cfg.referral_fee_pct, cfg.fba_fee_pct)
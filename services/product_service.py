@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from sqlalchemy.orm import Session
@@ -8,6 +10,7 @@ from sqlalchemy.orm import Session
 from clients.amazon_paapi import AmazonPAAPIClient
 from clients.keepa_client import KeepaClient
 from db.repository import ProductRepository, PriceRecordRepository, DealRepository
+from services.api_cache import get_keepa_cache, get_paapi_cache
 from services.price_analyzer import PriceAnalyzer
 from services.alert_service import AlertService
 
@@ -29,6 +32,9 @@ class ProductService:
 
     def add_product(self, asin: str, label: str = "", target_buy_price: float | None = None) -> dict[str, Any]:
         """Add a product to monitoring and do an initial price check."""
+        # Force fresh API data for the initial check
+        get_paapi_cache().invalidate(asin)
+        get_keepa_cache().invalidate(asin)
         product = self.product_repo.upsert(
             asin=asin,
             label=label,
@@ -47,30 +53,89 @@ class ProductService:
 
     def check_asins(self, asins: list[str]) -> list[dict[str, Any]]:
         """Fetch current prices, merge with Keepa data, detect deals."""
-        results = []
+        # The two APIs are independent, so fetch from both at once
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            paapi_future = pool.submit(self._fetch_paapi, asins)
+            keepa_future = pool.submit(self._fetch_keepa, asins)
+            paapi_items, keepa_items = paapi_future.result(), keepa_future.result()
+        return self._process_items(asins, paapi_items, keepa_items)
+
+    async def check_asins_async(self, asins: list[str]) -> list[dict[str, Any]]:
+        """Like check_asins, but fetches PA-API batches concurrently."""
+        loop = asyncio.get_running_loop()
+        paapi_items, keepa_items = await asyncio.gather(
+            self._fetch_paapi_async(asins),
+            loop.run_in_executor(None, self._fetch_keepa, asins),
+        )
+        # Database work uses the sync session, so keep it off the event loop
+        return await asyncio.to_thread(self._process_items, asins, paapi_items, keepa_items)
 
-        # Fetch from PA-API
-        paapi_items = self.paapi.get_items(asins) if self.paapi.is_configured() else []
-        paapi_map = {item["asin"]: item for item in paapi_items}
+    async def _fetch_paapi_async(self, asins: list[str]) -> list[dict[str, Any]]:
+        """Async variant of _fetch_paapi."""
+        if not self.paapi.is_configured():
+            return []
+        cache = get_paapi_cache()
+        items, stale = cache.partition(asins)
+        if stale:
+            fetched = await self.paapi.get_items_async(stale)
+            cache.put_many(fetched)
+            items.extend(fetched)
+        return items
+
+    def _fetch_paapi(self, asins: list[str]) -> list[dict[str, Any]]:
+        """PA-API items for ``asins``, served from the TTL cache where fresh."""
+        if not self.paapi.is_configured():
+            return []
+        return get_paapi_cache().fetch(asins, self.paapi.get_items)
 
-        # Fetch from Keepa
-        keepa_items = self.keepa.get_product_data(asins) if self.keepa.is_configured() else []
+    def _fetch_keepa(self, asins: list[str]) -> list[dict[str, Any]]:
+        """Keepa items for ``asins``, served from the TTL cache where fresh."""
+        if not self.keepa.is_configured():
+            return []
+        return get_keepa_cache().fetch(asins, self.keepa.get_product_data_batched)
+
+    def _process_items(
+        self,
+        asins: list[str],
+        paapi_items: list[dict[str, Any]],
+        keepa_items: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Store fetched API data, detect deals, and fire alerts.
+
+        Database reads and writes are done once for the whole batch; the
+        per-ASIN loop only merges data and runs the analyzer.
+        """
+        asins = list(dict.fromkeys(asins))
+        paapi_map = {item["asin"]: item for item in paapi_items}
         keepa_map = {item["asin"]: item for item in keepa_items}
 
+        # Merge into product records
+        self.product_repo.upsert_many([
+            {
+                "asin": asin,
+                "title": paapi_data.get("title"),
+                "brand": paapi_data.get("brand"),
+                "category": paapi_data.get("category"),
+                "image_url": paapi_data.get("image_url"),
+            }
+            for asin in asins
+            if (paapi_data := paapi_map.get(asin))
+        ])
+        targets = self.product_repo.get_targets_by_asins(asins)
+        # Read before this check's price rows are written
+        previous_records = self.price_repo.get_latest_for_asins(asins)
+
+        # Source label per ASIN, worked out once from the key sets
+        sources = dict.fromkeys(paapi_map, "paapi")
+        sources.update(dict.fromkeys(paapi_map.keys() & keepa_map.keys(), "paapi+keepa"))
+
+        results = []
+        price_rows = []
+        deal_rows = []
         for asin in asins:
             paapi_data = paapi_map.get(asin, {})
             keepa_data = keepa_map.get(asin, {})
 
-            # Merge into product record
-            if paapi_data:
-                self.product_repo.upsert(
-                    asin=asin,
-                    title=paapi_data.get("title"),
-                    brand=paapi_data.get("brand"),
-                    category=paapi_data.get("category"),
-                    image_url=paapi_data.get("image_url"),
-                )
-
             # Build price record
             price_data = {
                 "asin": asin,
@@ -84,43 +149,29 @@ class ProductService:
                 "avg_180d": keepa_data.get("avg_180d"),
                 "all_time_low": keepa_data.get("all_time_low"),
                 "all_time_high": keepa_data.get("all_time_high"),
-                "source": "paapi+keepa" if paapi_data and keepa_data else ("paapi" if paapi_data else "keepa"),
+                "source": sources.get(asin, "keepa"),
             }
 
             if price_data["current_price"] is not None:
-                self.price_repo.add(**price_data)
+                price_rows.append(price_data)
 
-            # Get previous record for comparison
-            previous_record = self.price_repo.get_latest(asin)
+            previous_record = previous_records.get(asin)
             prev_data = None
             if previous_record:
                 prev_data = {"current_price": previous_record.current_price}
 
             # Detect deals
-            product = self.product_repo.get_by_asin(asin)
-            target = product.target_buy_price if product else None
-
             signals = self.analyzer.detect_deals(
                 current={**paapi_data, **keepa_data},
                 previous=prev_data,
                 keepa_data=keepa_data or None,
-                target_buy_price=target,
+                target_buy_price=targets.get(asin),
             )
 
-            # Deactivate old deals and create new ones
-            if signals:
-                self.deal_repo.deactivate_for_asin(asin)
-                for signal in signals:
-                    deal = self.deal_repo.create(
-                        asin=asin,
-                        deal_type=signal.deal_type,
-                        trigger_price=signal.trigger_price,
-                        reference_price=signal.reference_price,
-                        drop_percent=signal.drop_percent,
-                        estimated_profit=signal.estimated_profit,
-                        estimated_roi=signal.estimated_roi,
-                    )
-                    self.alert_service.process_deal(asin, deal)
+            # The analyzer's rows already match the Deal columns
+            for row in signals:
+                row["asin"] = asin
+            deal_rows.extend(signals)
 
             results.append({
                 "asin": asin,
@@ -128,17 +179,34 @@ class ProductService:
                 "deals_found": len(signals),
             })
 
+        self.price_repo.add_many(price_rows)
+
+        # Replace old deals for ASINs with new signals, then alert once the
+        # deals are committed
+        if deal_rows:
+            self.deal_repo.deactivate_for_asins(list(dict.fromkeys(row["asin"] for row in deal_rows)))
+            deals = self.deal_repo.create_many(deal_rows)
+            self.alert_service.process_deals_batch([(deal.asin, deal) for deal in deals])
+
         return results
 
     def check_all_active(self) -> list[dict[str, Any]]:
         """Check prices for all active monitored products."""
-        products = self.product_repo.get_all_active()
-        asins = [p.asin for p in products]
+        asins = self._active_asins()
+        return self.check_asins(asins) if asins else []
+
+    async def check_all_active_async(self) -> list[dict[str, Any]]:
+        """Async variant of check_all_active for use from request handlers."""
+        asins = await asyncio.to_thread(self._active_asins)
+        return await self.check_asins_async(asins) if asins else []
+
+    def _active_asins(self) -> list[str]:
+        asins = [p.asin for p in self.product_repo.get_all_active()]
         if not asins:
             logger.info("No active products to check")
-            return []
-        logger.info(f"Checking {len(asins)} active products")
-        return self.check_asins(asins)
+        else:
+            logger.info(f"Checking {len(asins)} active products")
+        return asins
 
     def search_products(self, keywords: str, max_results: int = 10) -> list[dict[str, Any]]:
         """Search Amazon via PA-API."""
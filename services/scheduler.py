@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import logging
 
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from config.settings import get_settings
-from db.database import get_session_factory
+from db.database import get_scoped_session, remove_session
 from services.product_service import ProductService
 
 logger = logging.getLogger(__name__)
@@ -17,8 +18,7 @@ _scheduler: BackgroundScheduler | None = None
 def _run_price_check():
     """Scheduled job: check all active products."""
     logger.info("Scheduled price check starting...")
-    factory = get_session_factory()
-    session = factory()
+    session = get_scoped_session()()
     try:
         service = ProductService(session)
         results = service.check_all_active()
@@ -27,14 +27,20 @@ def _run_price_check():
     except Exception as e:
         logger.error(f"Scheduled price check failed: {e}")
     finally:
-        session.close()
+        remove_session()
 
 
 def start_scheduler() -> BackgroundScheduler:
     global _scheduler
     settings = get_settings().monitoring
 
-    _scheduler = BackgroundScheduler()
+    # One worker and one instance: if a check overruns the interval the next
+    # run is skipped rather than started alongside it, and a backlog of
+    # missed runs collapses into one (dropped if more than a minute late)
+    _scheduler = BackgroundScheduler(
+        executors={"default": ThreadPoolExecutor(1)},
+        job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 60},
+    )
     _scheduler.add_job(
         _run_price_check,
         trigger=IntervalTrigger(minutes=settings.check_interval_minutes),